@@ -2,62 +2,348 @@ import functools
 import inspect
 import typing
 from collections.abc import Callable, Generator
+from types import GeneratorType
 from typing import Any
 
 from .validators.bases import GeneratorValidator, Validator
 
 
+@functools.lru_cache(maxsize=512)
+def _extract_validators(
+    annotation: Any,
+) -> tuple[tuple[Validator, ...], bool] | None:
+    """
+    Pull the Validator instances out of an `Annotated[...]` annotation.
+
+    Returns a (validators, has_generator_validator) tuple, or None when the
+    annotation is not `Annotated` or carries no validators. Cached because the
+    same annotation object is typically reused across many decorated
+    functions in a module.
+    """
+    if typing.get_origin(annotation) is not typing.Annotated:
+        return None
+
+    _, *annotations = typing.get_args(annotation)
+    validators = tuple(v for v in annotations if isinstance(v, Validator))
+    if not validators:
+        return None
+
+    has_generator_validator = any(
+        isinstance(v, GeneratorValidator) for v in validators
+    )
+    return validators, has_generator_validator
+
+
+def _compile_binder(
+    sig: inspect.Signature, func: Callable
+) -> Callable[..., dict[str, Any]]:
+    """
+    Generate a function that mirrors `sig`'s exact parameter list and returns
+    the passed arguments as a {name: value} dict with defaults applied.
+
+    This replaces `sig.bind(...)` + `apply_defaults()` on the hot path with a
+    single native function call -- the same technique dataclasses use for
+    their generated `__init__` methods. The generated function takes over
+    `func`'s name so arity errors report the decorated function, not the
+    binder.
+    """
+    namespace: dict[str, Any] = {}
+    declarations: list[str] = []
+    items: list[str] = []
+
+    parameters = list(sig.parameters.values())
+    for index, param in enumerate(parameters):
+        declaration = param.name
+        if param.default is not param.empty:
+            default_name = f"__pe_default_{index}"
+            namespace[default_name] = param.default
+            declaration = f"{param.name}={default_name}"
+
+        if param.kind is param.VAR_POSITIONAL:
+            declaration = f"*{param.name}"
+        elif param.kind is param.VAR_KEYWORD:
+            declaration = f"**{param.name}"
+        elif param.kind is param.KEYWORD_ONLY and not any(
+            p.kind is p.VAR_POSITIONAL for p in parameters
+        ):
+            if index == 0 or parameters[index - 1].kind is not param.KEYWORD_ONLY:
+                declarations.append("*")
+
+        declarations.append(declaration)
+        items.append(f"{param.name!r}: {param.name}")
+
+        if param.kind is param.POSITIONAL_ONLY and (
+            index + 1 == len(parameters)
+            or parameters[index + 1].kind is not param.POSITIONAL_ONLY
+        ):
+            declarations.append("/")
+
+    source = (
+        f"def __pe_bind({', '.join(declarations)}):\n"
+        f"    return {{{', '.join(items)}}}"
+    )
+    exec(source, namespace)
+    binder = namespace["__pe_bind"]
+    binder.__name__ = func.__name__
+    binder.__qualname__ = func.__qualname__
+    return binder
+
+
+def _compile_caller(sig: inspect.Signature, func: Callable) -> Callable:
+    """
+    Generate a function that forwards a {name: value} dict produced by the
+    binder from `_compile_binder` to `func`, passing each argument the way
+    its parameter kind requires (positionally where possible) to avoid the
+    cost of a generic `func(**values)` expansion.
+    """
+    arguments: list[str] = []
+    for param in sig.parameters.values():
+        if param.kind is param.VAR_POSITIONAL:
+            arguments.append(f"*__pe_values[{param.name!r}]")
+        elif param.kind is param.VAR_KEYWORD:
+            arguments.append(f"**__pe_values[{param.name!r}]")
+        elif param.kind is param.KEYWORD_ONLY:
+            arguments.append(f"{param.name}=__pe_values[{param.name!r}]")
+        else:
+            arguments.append(f"__pe_values[{param.name!r}]")
+
+    namespace: dict[str, Any] = {"__pe_func": func}
+    source = (
+        f"def __pe_call(__pe_values):\n"
+        f"    return __pe_func({', '.join(arguments)})"
+    )
+    exec(source, namespace)
+    return namespace["__pe_call"]
+
+
+def _compile_action(
+    validator: Validator,
+    param_name: str,
+    func_name: str,
+    allow_duck_generators: bool,
+) -> Callable[[dict[str, Any]], bool | None]:
+    """
+    Build a pre-bound action for one (parameter, validator) pair.
+
+    Each action closes over everything it needs -- the validator's bound
+    methods, the parameter name and the prebuilt generator mismatch message --
+    so the per-call loop in `wrapper` is a branch-free `action(values)`.
+    An action returns True only when it wrote a replacement value back into
+    `values` (generator exhaustion or wrapping); the wrapper then knows the
+    original call arguments can no longer be forwarded as-is.
+
+    `allow_duck_generators` is True when the parameter carries at least one
+    GeneratorValidator; only then is the (slow) ABC isinstance fallback
+    consulted for values that are not exact GeneratorType instances.
+    """
+    _type = type
+    _isinstance = isinstance
+    _GeneratorType = GeneratorType
+    _Generator = Generator
+
+    # Inline cache keyed on the value's type: call sites see the same
+    # argument types over and over, so after warmup generator detection is a
+    # single dict hit instead of a type check plus the ABC fallback.
+    generator_types: dict[type, bool] = {}
+
+    if isinstance(validator, GeneratorValidator):
+        exhaust_generators = validator.exhaust_generators
+        wrap_generator = validator.wrap_generator
+        validate = validator.validate
+
+        def action(values: dict[str, Any]) -> bool | None:
+            value = values[param_name]
+            klass = _type(value)
+            is_generator = generator_types.get(klass)
+            if is_generator is None:
+                is_generator = klass is _GeneratorType or (
+                    allow_duck_generators and _isinstance(value, _Generator)
+                )
+                generator_types[klass] = is_generator
+
+            if is_generator:
+                if exhaust_generators:
+                    value = list(value)
+                    values[param_name] = value
+                    validate(value, func_name, param_name)
+                else:
+                    values[param_name] = wrap_generator(value, func_name, param_name)
+                return True
+
+            validate(value, func_name, param_name)
+            return None
+
+        return action
+
+    validate = validator.validate
+    mismatch_message = (
+        f"Parameter '{param_name}' for function '{func_name}' is a generator, but "
+        f"validator '{validator.__class__.__name__}' does not support validation of generators"  # noqa: E501
+    )
+
+    def action(values: dict[str, Any]) -> None:
+        value = values[param_name]
+        klass = _type(value)
+        is_generator = generator_types.get(klass)
+        if is_generator is None:
+            is_generator = klass is _GeneratorType or (
+                allow_duck_generators and _isinstance(value, _Generator)
+            )
+            generator_types[klass] = is_generator
+
+        if is_generator:
+            raise TypeError(mismatch_message)
+
+        validate(value, func_name, param_name)
+
+    return action
+
+
+def _compile_fused_generator_action(
+    validators: tuple[GeneratorValidator, ...],
+    param_name: str,
+    func_name: str,
+) -> Callable[[dict[str, Any]], bool | None]:
+    """
+    Build one action covering several lazy GeneratorValidators on the same
+    parameter.
+
+    Instead of chaining one wrapping generator per validator (one extra frame
+    per `next()` each), a generator argument is wrapped exactly once and each
+    validator's `per_element_check` hooks run inside that single frame.
+    Non-generator values are validated in order, as separate actions would.
+    """
+    _type = type
+    _isinstance = isinstance
+    _GeneratorType = GeneratorType
+    _Generator = Generator
+    validates = tuple(v.validate for v in validators)
+    check_factories = tuple(v.per_element_check for v in validators)
+    generator_types: dict[type, bool] = {}
+
+    def action(values: dict[str, Any]) -> bool | None:
+        value = values[param_name]
+        klass = _type(value)
+        is_generator = generator_types.get(klass)
+        if is_generator is None:
+            is_generator = klass is _GeneratorType or _isinstance(value, _Generator)
+            generator_types[klass] = is_generator
+
+        if is_generator:
+            hooks = [factory(func_name, param_name) for factory in check_factories]
+            checks = tuple(check for check, _ in hooks if check is not None)
+            on_empties = tuple(on_empty for _, on_empty in hooks if on_empty)
+
+            def fused(gen: Generator) -> Generator:
+                count = 0
+                for val in gen:
+                    for check in checks:
+                        check(val)
+
+                    count += 1
+                    yield val
+
+                if count == 0:
+                    for on_empty in on_empties:
+                        on_empty()
+
+            values[param_name] = fused(value)
+            return True
+
+        for validate in validates:
+            validate(value, func_name, param_name)
+        return None
+
+    return action
+
+
 def enforce(func: Callable) -> Callable:
     """
     A decorator that enforces validation rules defined in `Annotated` type hints.
     """
     sig = inspect.signature(func)
+    func_name = func.__name__
 
-    @functools.wraps(func)
-    def wrapper(*args: Any, **kwargs: Any) -> Any:
-        # Bind the passed arguments to the function's signature to get a mapping
-        # of parameter names to their values.
-        bound_args = sig.bind(*args, **kwargs)
-        bound_args.apply_defaults()
+    # Precompute the validation plan once at decoration time: one pre-bound
+    # action per (parameter, validator) pair, covering only parameters that
+    # actually carry validators.
+    actions: list[Callable[[dict[str, Any]], bool | None]] = []
+    for param_name, param in sig.parameters.items():
+        if param.annotation is param.empty:
+            continue
 
-        for param_name, param in sig.parameters.items():
-            if param.annotation is param.empty:
-                continue
-
-            if typing.get_origin(param.annotation) is not typing.Annotated:
-                continue
-
-            _, *validators = typing.get_args(param.annotation)
-            argument_value = bound_args.arguments[param_name]
+        try:
+            extracted = _extract_validators(param.annotation)
+        except TypeError:
+            # Unhashable annotations cannot go through the cache.
+            extracted = _extract_validators.__wrapped__(param.annotation)
+        if extracted is None:
+            continue
 
+        validators, has_generator_validator = extracted
+        # Only validators that implement per_element_check can be fused;
+        # subclasses that just override wrap_generator keep their own
+        # wrapping layer.
+        lazy_validators = tuple(
+            v
+            for v in validators
+            if isinstance(v, GeneratorValidator)
+            and not v.exhaust_generators
+            and type(v).per_element_check
+            is not GeneratorValidator.per_element_check
+        )
+        if len(lazy_validators) > 1:
+            # Several validators would each wrap a generator argument in its
+            # own layer; fuse them into a single wrapping action placed where
+            # the first of them appeared.
+            fused_emitted = False
             for validator in validators:
-                if not isinstance(validator, Validator):
-                    continue
-
-                if isinstance(argument_value, Generator):
-                    if not isinstance(validator, GeneratorValidator):
-                        raise TypeError(
-                            f"Parameter '{param_name}' for function '{func.__name__}' is a generator, but "  # noqa: E501
-                            f"validator '{validator.__class__.__name__}' does not support validation of generators"  # noqa: E501
+                if validator in lazy_validators:
+                    if not fused_emitted:
+                        actions.append(
+                            _compile_fused_generator_action(
+                                lazy_validators, param_name, func_name
+                            )
                         )
-
-                    if validator.exhaust_generators:
-                        argument_value = list(argument_value)
-                        bound_args.arguments[param_name] = argument_value
-                    else:
-                        bound_args.arguments[param_name] = validator.wrap_generator(
-                            argument_value,
-                            func_name=func.__name__,
-                            param_name=param_name,
+                        fused_emitted = True
+                else:
+                    actions.append(
+                        _compile_action(
+                            validator, param_name, func_name, has_generator_validator
                         )
-                        continue
-
-                validator.validate(
-                    value=argument_value,
-                    func_name=func.__name__,
-                    param_name=param_name,
+                    )
+        else:
+            actions.extend(
+                _compile_action(
+                    validator, param_name, func_name, has_generator_validator
                 )
+                for validator in validators
+            )
+
+    # No parameter carries a validator: return the function untouched so
+    # unvalidated functions pay zero per-call overhead.
+    if not actions:
+        return func
+
+    bind_arguments = _compile_binder(sig, func)
+    call_func = _compile_caller(sig, func)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # Bind the passed arguments to the function's signature to get a mapping
+        # of parameter names to their values.
+        values = bind_arguments(*args, **kwargs)
+
+        mutated = False
+        for action in actions:
+            if action(values):
+                mutated = True
 
-        return func(*bound_args.args, **bound_args.kwargs)
+        # Only route through the forwarding trampoline when a validator wrote
+        # a replacement value back; otherwise the original arguments are
+        # still exactly what the function should receive.
+        if mutated:
+            return call_func(values)
+        return func(*args, **kwargs)
 
     return wrapper
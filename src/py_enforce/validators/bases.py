@@ -1,11 +1,19 @@
-import abc
+from collections.abc import Callable
 from typing import Any, Generator
 
 
-class Validator(abc.ABC):
-    """Base class for all validators."""
+class Validator:
+    """
+    Base class for all validators.
+
+    A plain class rather than an ABC: isinstance checks against ABCs go
+    through ABCMeta.__instancecheck__, and the decorator runs that check for
+    every annotation at decoration time. Subclasses must implement
+    `validate`.
+    """
+
+    __slots__ = ()
 
-    @abc.abstractmethod
     def validate(self, value: Any, func_name: str, param_name: str) -> None:
         """
         Performs validation on the given value.
@@ -19,23 +27,48 @@ class Validator(abc.ABC):
             ValidationError: If validation fails.
             TypeError: If a validator is used on an incompatible type
         """
-        ...  # pragma: no cover
+        raise NotImplementedError  # pragma: no cover
 
 
 class GeneratorValidator(Validator):
     """Base class for all validators that support handling generators"""
 
+    __slots__ = ("exhaust_generators",)
+
     def __init__(self, exhaust_generators: bool = False) -> None:
         super().__init__()
         self.exhaust_generators = exhaust_generators
 
-    @abc.abstractmethod
+    def per_element_check(
+        self, func_name: str, param_name: str
+    ) -> tuple[Callable[[Any], None] | None, Callable[[], None] | None]:
+        """
+        Builds the lazy validation hooks for one wrapped generator.
+
+        Each call returns fresh, stateful hooks, so the same validator
+        instance can wrap any number of generators independently.
+
+        Args:
+            func_name (str): The name of the function being validated.
+            param_name (str): The name of the parameter being validated.
+
+        Returns:
+            tuple: A (check, on_empty) pair. `check(value)` is invoked for
+            every element the generator yields and raises on failure;
+            `on_empty()` is invoked if the generator yields no elements at
+            all. Either hook may be None when the validator does not need it.
+        """
+        raise NotImplementedError  # pragma: no cover
+
     def wrap_generator[T](
         self, value: Generator[T], func_name: str, param_name: str
     ) -> Generator[T]:
         """
         Wraps a generator with lazy validation logic, performing on-the-fly validation.
 
+        The default implementation drives the hooks returned by
+        `per_element_check`; subclasses normally only implement that method.
+
         Args:
             value (collections.abc.Generator): The generator to wrap.
             func_name (str): The name of the function being validated.
@@ -44,4 +77,18 @@ class GeneratorValidator(Validator):
         Raises:
             ValidationError: If validation fails
         """
-        ...  # pragma: no cover
+        check, on_empty = self.per_element_check(func_name, param_name)
+
+        def wrapper(gen: Generator[T]) -> Generator[T]:
+            count = 0
+            for val in gen:
+                if check is not None:
+                    check(val)
+
+                count += 1
+                yield val
+
+            if count == 0 and on_empty is not None:
+                on_empty()
+
+        return wrapper(value)
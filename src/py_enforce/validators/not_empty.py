@@ -1,8 +1,17 @@
-from collections.abc import Generator, Sized
+from collections.abc import Callable, Generator, Sized
+from typing import Any
 
 from ..exceptions import ValidationError
 from .bases import GeneratorValidator
 
+# Builtin types checked by exact type before falling back to the (slower)
+# Sized ABC isinstance, which traverses __subclasshook__.
+_SIZED_FAST = (list, tuple, str, bytes, dict, set, frozenset, bytearray)
+
+# Memo of ABC check results for non-builtin types, so each user-defined type
+# pays the Sized isinstance once instead of on every call.
+_sized_types: dict[type, bool] = {}
+
 
 class NotEmpty(GeneratorValidator):
     """
@@ -12,6 +21,8 @@ class NotEmpty(GeneratorValidator):
     (i.e., conforms to collections.abc.Sized).
     """
 
+    __slots__ = ()
+
     def validate(self, value: Sized, func_name: str, param_name: str) -> None:
         """
         Checks if the value is not empty.
@@ -25,18 +36,48 @@ class NotEmpty(GeneratorValidator):
             ValidationError: If the value is empty.
             TypeError: If the value is not of type collections.abc.Sized.
         """  # noqa: E501
-        if not isinstance(value, Sized):
-            raise TypeError(
-                "Validator 'NotEmpty' can only be used on types that support len() "
-                f"(collections.abc.Sized), but function '{func_name}' "
-                f"got type '{type(value).__name__}' for parameter '{param_name}'."
-            )
+        klass = type(value)
+        if klass not in _SIZED_FAST:
+            is_sized = _sized_types.get(klass)
+            if is_sized is None:
+                is_sized = isinstance(value, Sized)
+                _sized_types[klass] = is_sized
+
+            if not is_sized:
+                raise TypeError(
+                    "Validator 'NotEmpty' can only be used on types that support len() "  # noqa: E501
+                    f"(collections.abc.Sized), but function '{func_name}' "
+                    f"got type '{klass.__name__}' for parameter '{param_name}'."
+                )
 
         if len(value) == 0:
             raise ValidationError(
                 f"Parameter '{param_name}' cannot be empty for function '{func_name}'."
             )
 
+    def per_element_check(
+        self, func_name: str, param_name: str
+    ) -> tuple[Callable[[Any], None] | None, Callable[[], None] | None]:
+        """
+        Builds the empty-generator hook for one wrapped generator.
+
+        Args:
+            func_name (str): The name of the function being validated.
+            param_name (str): The name of the parameter being validated.
+
+        Returns:
+            tuple: A (check, on_empty) pair; `check` is None since any
+            yielded element already proves the generator is not empty.
+        """
+        error_message = (
+            f"Parameter '{param_name}' cannot be empty for function '{func_name}'."
+        )
+
+        def on_empty() -> None:
+            raise ValidationError(error_message)
+
+        return None, on_empty
+
     def wrap_generator[T](
         self, value: Generator[T], func_name: str, param_name: str
     ) -> Generator[T]:
@@ -55,14 +96,18 @@ class NotEmpty(GeneratorValidator):
             ValidationError: If the generator is empty (produces no values).
         """  # noqa: E501
 
+        # Build the failure message once instead of formatting it (and paying
+        # the closure-cell accesses) inside the generator.
+        error_message = (
+            f"Parameter '{param_name}' cannot be empty for function '{func_name}'."
+        )
+
         def wrapper(gen: Generator[T]) -> Generator[T]:
             # Try to fetch the first value from the generator
             try:
                 val = next(gen)
             except StopIteration:
-                raise ValidationError(
-                    f"Parameter '{param_name}' cannot be empty for function '{func_name}'."  # noqa: E501
-                )
+                raise ValidationError(error_message)
             else:
                 yield val
 
@@ -1,8 +1,21 @@
-from collections.abc import Collection, Generator
+from collections.abc import Callable, Collection, Generator
+from typing import Any
 
 from ..exceptions import ValidationError
 from .bases import GeneratorValidator
 
+# Builtin types checked by exact type before falling back to the (slower)
+# Collection ABC isinstance, which traverses __subclasshook__.
+_COLLECTION_FAST = (list, tuple, str, bytes, dict, set, frozenset, bytearray)
+
+# Memo of ABC check results for non-builtin types, so each user-defined type
+# pays the Collection isinstance once instead of on every call.
+_collection_types: dict[type, bool] = {}
+
+# Below this size the per-element Python loop wins; at or above it, building
+# the set in one C-level pass is cheaper than interpreting the loop.
+_EARLY_EXIT_THRESHOLD = 64
+
 
 class Unique(GeneratorValidator):
     """
@@ -12,6 +25,8 @@ class Unique(GeneratorValidator):
     (i.e. conforms to the collections.abc.Collection).
     """
 
+    __slots__ = ()
+
     def validate(self, value: Collection, func_name: str, param_name: str) -> None:
         """
         Checks if value contains only unique elements.
@@ -25,22 +40,94 @@ class Unique(GeneratorValidator):
             ValidationError: If validation fails.
             TypeError: If the value is not of type collections.abc.Collection
         """  # noqa: E501
-        if not isinstance(value, Collection):
-            raise TypeError(
-                "Validator 'Unique' can only be used on types that are iterable and "
-                f"contain hashable elements (Collection), but function '{func_name}' "
-                f"got type '{type(value).__name__}' for paramter '{param_name}'"
-            )
+        klass = type(value)
+        if klass not in _COLLECTION_FAST:
+            is_collection = _collection_types.get(klass)
+            if is_collection is None:
+                is_collection = isinstance(value, Collection)
+                _collection_types[klass] = is_collection
+
+            if not is_collection:
+                raise TypeError(
+                    "Validator 'Unique' can only be used on types that are iterable "
+                    f"and contain hashable elements (Collection), but function "
+                    f"'{func_name}' got type '{klass.__name__}' for paramter "
+                    f"'{param_name}'"
+                )
 
         if isinstance(value, set):
             return
 
-        if len(value) != len(set(value)):
+        # str/bytes fast path: set(bytes) hashes small ints instead of boxing
+        # every character into its own length-1 string. Only safe for ASCII
+        # text -- multi-byte encodings could alias bytes across characters.
+        if type(value) is str and value.isascii():
+            encoded = value.encode()
+            if len(set(encoded)) != len(encoded):
+                raise ValidationError(
+                    f"Parameter '{param_name}' must contain unique elements "
+                    f"for function {func_name}"
+                )
+            return
+
+        if type(value) is bytes:
+            if len(set(value)) != len(value):
+                raise ValidationError(
+                    f"Parameter '{param_name}' must contain unique elements "
+                    f"for function {func_name}"
+                )
+            return
+
+        length = len(value)
+        if length < _EARLY_EXIT_THRESHOLD:
+            # Single early-exit pass: bail out on the first duplicate found.
+            seen = set()
+            add = seen.add
+            for element in value:
+                if element in seen:
+                    raise ValidationError(
+                        f"Parameter '{param_name}' must contain unique elements "
+                        f"for function {func_name}"
+                    )
+                add(element)
+        elif len(set(value)) != length:
             raise ValidationError(
                 f"Parameter '{param_name}' must contain unique elements "
                 f"for function {func_name}"
             )
 
+    def per_element_check(
+        self, func_name: str, param_name: str
+    ) -> tuple[Callable[[Any], None] | None, Callable[[], None] | None]:
+        """
+        Builds a per-element uniqueness check for one wrapped generator.
+
+        Args:
+            func_name (str): The name of the function being validated.
+            param_name (str): The name of the parameter being validated.
+
+        Returns:
+            tuple: A (check, on_empty) pair; `on_empty` is None since an
+            empty generator is trivially unique.
+        """
+        error_message = (
+            f"Parameter '{param_name}' must contain unique elements "
+            f"for function {func_name}"
+        )
+        seen = set()
+        seen_add = seen.add
+        expected = 1
+
+        def check(val: Any) -> None:
+            nonlocal expected
+            seen_add(val)
+            if len(seen) != expected:
+                raise ValidationError(error_message)
+
+            expected += 1
+
+        return check, None
+
     def wrap_generator[T](
         self, value: Generator[T], func_name: str, param_name: str
     ) -> Generator[T]:
@@ -59,16 +146,26 @@ class Unique(GeneratorValidator):
             ValidationError: If duplicate elements are encountered.
         """
 
+        # Build the failure message once instead of formatting it (and paying
+        # the closure-cell accesses) inside the generator.
+        error_message = (
+            f"Parameter '{param_name}' must contain unique elements "
+            f"for function {func_name}"
+        )
+
         def wrapper(gen: Generator[T]) -> Generator[T]:
+            # Add first and detect duplicates via the set's size, so each
+            # element is hashed once instead of twice (`in` check + `add`).
+            # `expected` tracks the size the set must have after each insert.
             seen = set()
+            seen_add = seen.add
+            expected = 1
             for val in gen:
-                if val in seen:
-                    raise ValidationError(
-                        f"Parameter '{param_name}' must contain unique elements "
-                        f"for function {func_name}"
-                    )
+                seen_add(val)
+                if len(seen) != expected:
+                    raise ValidationError(error_message)
 
+                expected += 1
                 yield val
-                seen.add(val)
 
         return wrapper(value)
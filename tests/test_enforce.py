@@ -4,8 +4,8 @@ from typing import Annotated, Any
 import pytest
 
 from py_enforce import ValidationError, enforce
-from py_enforce.validators import NotEmpty
-from py_enforce.validators.bases import Validator
+from py_enforce.validators import NotEmpty, Unique
+from py_enforce.validators.bases import GeneratorValidator, Validator
 
 
 def test_function_with_no_annotations():
@@ -71,3 +71,182 @@ def test_function_with_generator_incompatible_validator():
         TypeError, match="Parameter 'data' for function 'some_function' is a generator"
     ):
         some_function(data=(i for i in range(10)))
+
+
+def test_function_with_positional_only_parameters():
+    """Tests that validation works for functions with positional-only parameters."""
+
+    @enforce
+    def positional_only(name: Annotated[str, NotEmpty()], /, suffix: str = "!"):
+        return f"{name}{suffix}"
+
+    assert positional_only("hello") == "hello!"
+
+    with pytest.raises(ValidationError):
+        positional_only("")
+
+
+def test_function_with_var_positional_and_keyword_only():
+    """Tests validation with *args and keyword-only parameters in the signature."""
+
+    @enforce
+    def collect(name: Annotated[str, NotEmpty()], *extras: Any, sep: str = "-"):
+        return sep.join([name, *extras])
+
+    assert collect("a", "b", "c") == "a-b-c"
+    assert collect("a", "b", sep="+") == "a+b"
+
+    with pytest.raises(ValidationError):
+        collect("", "b")
+
+
+def test_function_with_var_keyword():
+    """Tests that extra keyword arguments are routed through to **kwargs."""
+
+    @enforce
+    def configure(name: Annotated[str, NotEmpty()], **options: Any):
+        return name, options
+
+    assert configure("server", port=8080, debug=True) == (
+        "server",
+        {"port": 8080, "debug": True},
+    )
+
+    with pytest.raises(ValidationError):
+        configure("", port=8080)
+
+
+def test_function_default_value_identity():
+    """Tests that default values are passed through by identity, not copied."""
+
+    sentinel = object()
+
+    @enforce
+    def with_default(items: Annotated[list, NotEmpty()], marker: Any = sentinel):
+        return marker
+
+    assert with_default([1]) is sentinel
+
+
+def test_wrong_arity_reports_function_name():
+    """Tests that calling with missing arguments raises a TypeError naming the function."""  # noqa: E501
+
+    @enforce
+    def needs_an_argument(items: Annotated[list, NotEmpty()]):
+        return items
+
+    with pytest.raises(TypeError, match="needs_an_argument"):
+        needs_an_argument()
+
+
+# --- Multiple Validators Per Parameter ---
+
+
+@enforce
+def process_checked(items: Annotated[Any, NotEmpty(), Unique()]):
+    """Function with two validators on a single parameter."""
+    return list(items)
+
+
+def test_multiple_validators_on_collection_success():
+    """Tests that a collection satisfying both validators passes."""
+    assert process_checked([1, 2, 3]) == [1, 2, 3]
+
+
+def test_multiple_validators_on_collection_fail_empty():
+    """Tests that an empty collection fails the NotEmpty validator."""
+    with pytest.raises(
+        ValidationError, match="Parameter 'items' cannot be empty."
+    ):
+        process_checked([])
+
+
+def test_multiple_validators_on_collection_fail_duplicates():
+    """Tests that a collection with duplicates fails the Unique validator."""
+    with pytest.raises(
+        ValidationError, match="Parameter 'items' must contain unique elements."
+    ):
+        process_checked([1, 2, 1])
+
+
+def test_multiple_validators_on_generator_success():
+    """Tests that a non-empty generator of unique elements passes both validators."""
+
+    gen = (i for i in range(5))
+    assert process_checked(gen) == [0, 1, 2, 3, 4]
+
+
+def test_multiple_validators_on_generator_fail_empty():
+    """Tests that an empty generator fails the NotEmpty validator."""
+
+    gen = (i for i in range(0))
+    with pytest.raises(
+        ValidationError, match="Parameter 'items' cannot be empty."
+    ):
+        process_checked(gen)
+
+
+def test_multiple_validators_on_generator_fail_duplicates():
+    """Tests that a generator with duplicates fails the Unique validator lazily."""
+
+    gen = (i for i in [1, 2, 2, 3])
+    with pytest.raises(
+        ValidationError, match="Parameter 'items' must contain unique elements."
+    ):
+        process_checked(gen)
+
+
+def test_per_element_check_subclass_is_fused():
+    """Tests that a custom per_element_check implementation runs in the fused wrapper."""  # noqa: E501
+
+    class NoNegatives(GeneratorValidator):
+        def validate(self, value, func_name, param_name) -> None: ...
+
+        def per_element_check(self, func_name, param_name):
+            def check(val) -> None:
+                if val < 0:
+                    raise ValidationError(
+                        f"Parameter '{param_name}' cannot contain negative values "
+                        f"for function '{func_name}'."
+                    )
+
+            return check, None
+
+    @enforce
+    def process(items: Annotated[Any, NoNegatives(), Unique()]):
+        return list(items)
+
+    assert process(i for i in range(3)) == [0, 1, 2]
+
+    with pytest.raises(
+        ValidationError, match="Parameter 'items' cannot contain negative values"
+    ):
+        process(i for i in [1, -1])
+
+
+def test_wrap_generator_only_subclass_is_chained():
+    """
+    Tests that a GeneratorValidator implementing only wrap_generator still works
+    alongside another lazy validator on the same parameter.
+    """
+
+    class Doubler(GeneratorValidator):
+        def validate(self, value, func_name, param_name) -> None: ...
+
+        def wrap_generator(self, value, func_name, param_name):
+            def wrapper(gen):
+                for val in gen:
+                    yield val * 2
+
+            return wrapper(value)
+
+    @enforce
+    def process(items: Annotated[Any, Doubler(), Unique()]):
+        return list(items)
+
+    assert process(i for i in [1, 2, 3]) == [2, 4, 6]
+
+    with pytest.raises(
+        ValidationError, match="Parameter 'items' must contain unique elements."
+    ):
+        process(i for i in [1, 1])